@@ -1,3 +1,38 @@
-from .processors import DataProcessor, StandardDataProcessor, StandardizableDataProcessor, SequentialDataProcessor, ForwardDataProcessor
-from .learning import InputMan, SupervisedLearner, InputManDataFrames
-from .regressors import PolynomialRegressor, StandardizableRegressor
\ No newline at end of file
+import importlib as _importlib
+
+__all__ = [
+    'DataProcessor', 'StandardDataProcessor', 'StandardizableDataProcessor', 'SequentialDataProcessor', 'ForwardDataProcessor',
+    'InputMan', 'SupervisedLearner', 'InputManDataFrames',
+    'PolynomialRegressor', 'StandardizableRegressor',
+]
+
+_LAZY_ATTRS = {
+    'DataProcessor' : '.processors',
+    'StandardDataProcessor' : '.processors',
+    'StandardizableDataProcessor' : '.processors',
+    'SequentialDataProcessor' : '.processors',
+    'ForwardDataProcessor' : '.processors',
+    'InputMan' : '.learning',
+    'SupervisedLearner' : '.learning',
+    'InputManDataFrames' : '.learning',
+    'PolynomialRegressor' : '.regressors',
+    'StandardizableRegressor' : '.regressors',
+}
+
+_SUBMODULES = ('processors', 'learning', 'regressors')
+
+def __getattr__(name : str):
+    if name in _SUBMODULES:
+        return _importlib.import_module('.' + name, __name__)
+
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = _importlib.import_module(_LAZY_ATTRS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+def __dir__():
+    return sorted({n for n in globals().keys() if not n.startswith('_')} | set(__all__))
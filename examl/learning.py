@@ -1,9 +1,10 @@
-from typing import Callable, Mapping, Iterable, OrderedDict
-import pandas as pd
-from pandas import DataFrame
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Mapping, Iterable, OrderedDict
 from .processors import DataProcessor
 
-from sklearn.model_selection import train_test_split, GridSearchCV
+if TYPE_CHECKING:
+    import pandas as pd
+    from pandas import DataFrame
 
 class InputMan:
     def normalize(self) -> pd.DataFrame:
@@ -23,6 +24,8 @@ class MultiDFInputMan(InputMan):
          self.__dfs = dfs
 
     def normalize(self) -> DataFrame:
+        import pandas as pd
+
         dfArray = []
 
         for df in self.__dfs:
@@ -40,10 +43,13 @@ class XLSFileInputMan(InputMan):
         self.__processor = processor
 
     def loadSheet(self, sheet_name : str) -> DataFrame:
+        import pandas as pd
         return pd.read_excel(self.__file, sheet_name = sheet_name)
         
 
     def normalize(self) -> DataFrame:
+        import pandas as pd
+
         sheetDataArray = []
 
         for sheet_name in self.__processor.keys():
@@ -83,6 +89,8 @@ class SupervisedLearner:
 
     def acquireKnowledge(self, df : pd.DataFrame, targetCol : str, testSize = 0.2, firstDataProcessor : DataProcessor = None, 
         ramdomState = None, getTempData : Callable[[str, object], object] = None, trainMetrics : bool = False, excludeRegressors : Iterable[object] = []):
+        from sklearn.model_selection import train_test_split
+
         res = OrderedDict()
 
         if not firstDataProcessor is None:
@@ -229,6 +237,8 @@ class SupervisedLearner:
 
 
     def generateReport(self, knowledgeCollection : Mapping[str, object], order) -> DataFrame:
+        import pandas as pd
+
         initProcs = []
         procs = []
         regs = []
@@ -270,13 +280,14 @@ class SupervisedLearner:
         for ek in evals.keys():
             data[ek] = evals[ek]
 
-        regReportDF = DataFrame(data).sort_values(order, ascending=False)
+        regReportDF = pd.DataFrame(data).sort_values(order, ascending=False)
 
         return regReportDF
         
         
 
     def optimize(estimator : Callable[[], object], tunedParameters, x, y, scoring : Iterable[str]):
+        from sklearn.model_selection import GridSearchCV
 
         res = OrderedDict()
         for s in scoring:
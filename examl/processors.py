@@ -1,7 +1,9 @@
-from typing import Callable, Mapping, OrderedDict, Sequence, Dict, Iterable
-import pandas as pd
-import numpy as np
-from pandas import DataFrame
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, Mapping, OrderedDict, Sequence, Dict, Iterable
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from pandas import DataFrame
 
 class AggConfig:
     def __init__(self, gbColumns : Sequence[str], aggFuncConfig : Sequence[Dict] ):
@@ -84,6 +86,8 @@ class StandardDataProcessor(DataProcessor):
                     df.drop(ncConfig['drop'], axis=1, inplace=True)
 
         if not self.__digitColumns is None:
+            import pandas as pd
+
             for colToDigitalize in self.__digitColumns.keys():
                 digitConfig = self.__digitColumns[colToDigitalize]
                 nbValue = digitConfig['nbValue']
@@ -183,7 +187,7 @@ class ForwardDataProcessor(DataProcessor):
             
         v0 = df[condition][self.__targetField]
         
-        return np.nan if len(v0.values) == 0 else v0.values[0]
+        return float('nan') if len(v0.values) == 0 else v0.values[0]
         
     
     def fit(self, df: DataFrame):
@@ -1,20 +1,26 @@
-from typing import Callable
-from pandas import DataFrame
-from sklearn.preprocessing import PolynomialFeatures
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 class PolynomialRegressor:
     
     def __init__(self, regressor : Callable[[], object], degree = 2 ):
+        from sklearn.preprocessing import PolynomialFeatures
+
         self.__regressor = regressor()
         self.__poly = PolynomialFeatures(degree=degree, include_bias=False)
         
         
     def __normalizeDF(self, df : DataFrame):
+        import pandas as pd
+
         data = dict()
         for col in  df.columns:
             data[col] = df[col].squeeze()
             
-        return DataFrame(data)
+        return pd.DataFrame(data)
     
     def fit(self, xDF, YDF):
         tmpDF = self.__normalizeDF(xDF)
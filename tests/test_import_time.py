@@ -0,0 +1,67 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ('pandas', 'numpy', 'sklearn', 'scipy')
+
+# Wall-clock budget, in seconds, for `import examl` plus resolving every public
+# name and submodule in a fresh interpreter.
+IMPORT_TIME_BUDGET = 0.1
+
+def runPython(code : str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+def loadedHeavyModules(code : str) -> str:
+    code += f"\nimport sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+
+    return runPython(code).stdout.strip()
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_public_names_do_not_load_heavy_modules(self):
+        code = (
+            "import examl\n"
+            "for name in examl.__all__: getattr(examl, name)\n"
+            "examl.StandardDataProcessor(uselessColumns=['a'])\n"
+        )
+        loaded = loadedHeavyModules(code)
+
+        self.assertEqual(loaded, '', f"heavy modules loaded at import time: {loaded}")
+
+    def test_submodules_by_attribute(self):
+        code = (
+            "import examl\n"
+            "examl.processors.AggConfig(['a'], [{'b' : 'sum'}])\n"
+            "examl.learning.SupervisedLearner\n"
+            "examl.regressors.PolynomialRegressor\n"
+        )
+        loaded = loadedHeavyModules(code)
+
+        self.assertEqual(loaded, '', f"heavy modules loaded at import time: {loaded}")
+
+    def test_import_time_budget(self):
+        code = (
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import examl\n"
+            "for name in examl.__all__: getattr(examl, name)\n"
+            "examl.processors, examl.learning, examl.regressors\n"
+            "print(time.perf_counter() - start)\n"
+        )
+        elapsed = float(runPython(code).stdout.strip())
+
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_unknown_attribute(self):
+        code = (
+            "import examl\n"
+            "try: examl.missing\n"
+            "except AttributeError: print('ok')\n"
+        )
+        self.assertEqual(runPython(code).stdout.strip(), 'ok')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from importlib.util import find_spec
+
+from examl import DataProcessor, SupervisedLearner
+from examl.learning import MultiDFInputMan, XLSFileInputMan
+
+@unittest.skipUnless(find_spec('pandas'), "pandas is not installed")
+class InputManTest(unittest.TestCase):
+
+    def test_multi_df_normalize(self):
+        import pandas as pd
+
+        inputMan = MultiDFInputMan(DataProcessor(), [pd.DataFrame({'a' : [1]}), pd.DataFrame({'a' : [2, 3]})])
+
+        self.assertEqual(list(inputMan.normalize()['a']), [1, 2, 3])
+
+    @unittest.skipUnless(find_spec('openpyxl'), "openpyxl is not installed")
+    def test_xls_file_normalize(self):
+        import pandas as pd
+
+        with tempfile.TemporaryDirectory() as tmp:
+            file = os.path.join(tmp, 'data.xlsx')
+            with pd.ExcelWriter(file) as writer:
+                pd.DataFrame({'a' : [1]}).to_excel(writer, sheet_name='s1', index=False)
+                pd.DataFrame({'a' : [2]}).to_excel(writer, sheet_name='s2', index=False)
+
+            inputMan = XLSFileInputMan(file, {'s1' : DataProcessor(), 's2' : DataProcessor()})
+
+            self.assertEqual(list(inputMan.normalize()['a']), [1, 2])
+
+@unittest.skipUnless(find_spec('pandas') and find_spec('sklearn'), "pandas and scikit-learn are required")
+class SupervisedLearnerTest(unittest.TestCase):
+
+    def __frame(self):
+        import pandas as pd
+
+        x = [float(i) for i in range(20)]
+
+        return pd.DataFrame({'x' : x, 'y' : [2 * v + 1 for v in x]})
+
+    def test_acquire_knowledge_and_report(self):
+        from sklearn.linear_model import LinearRegression
+        from sklearn.metrics import r2_score
+
+        learner = SupervisedLearner({'raw' : DataProcessor()}, {'linear' : LinearRegression}, {'r2' : r2_score})
+
+        knowledge = learner.acquireKnowledge(self.__frame(), 'y', ramdomState=0, trainMetrics=True)
+        reg = knowledge['processors']['raw']['regressors']['linear']
+
+        self.assertAlmostEqual(reg['scoring-test']['r2'], 1.0)
+
+        report = learner.generateReport({'all' : knowledge}, 'Test-r2')
+
+        self.assertEqual(list(report.columns), ['Collection name', 'Processors', 'Regressor', 'Train-r2', 'Test-r2'])
+        self.assertEqual(list(report['Regressor']), ['linear'])
+
+    def test_optimize(self):
+        from sklearn.linear_model import Ridge
+
+        df = self.__frame()
+
+        res = SupervisedLearner.optimize(Ridge, {'alpha' : [0.1, 1.0]}, df[['x']], df['y'], ['r2'])
+
+        self.assertIn(res['r2']['best-params']['alpha'], [0.1, 1.0])
+        self.assertIn('cv-results', res['r2'])
+
+if __name__ == '__main__':
+    unittest.main()
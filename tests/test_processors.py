@@ -0,0 +1,47 @@
+import math
+import unittest
+from importlib.util import find_spec
+
+from examl import StandardDataProcessor, ForwardDataProcessor
+
+@unittest.skipUnless(find_spec('pandas'), "pandas is not installed")
+class StandardDataProcessorTest(unittest.TestCase):
+
+    def test_digit_columns(self):
+        import pandas as pd
+
+        df = pd.DataFrame({'c' : ['a', 'b', 'a']})
+        processor = StandardDataProcessor(digitColumns={'c' : {'nbValue' : 2, 'mapFunc' : lambda i, x : int(x == 'ab'[i])}})
+
+        res = processor.execute(df)
+
+        self.assertEqual(list(res.columns), ['c', 'c_1', 'c_2'])
+        self.assertEqual(list(res['c_1']), [1, 0, 1])
+        self.assertEqual(list(res['c_2']), [0, 1, 0])
+
+@unittest.skipUnless(find_spec('pandas'), "pandas is not installed")
+class ForwardDataProcessorTest(unittest.TestCase):
+
+    def __frame(self):
+        import pandas as pd
+
+        return pd.DataFrame({'k' : ['x', 'x', 'y'], 'year' : [2020, 2021, 2020], 'v' : [1.0, 2.0, 3.0]})
+
+    def test_execute(self):
+        processor = ForwardDataProcessor('v', 'year', ['k'], lambda e : e + 1, dropTargetNa=False)
+
+        res = processor.execute(self.__frame())
+
+        self.assertEqual(res['v_future'].iloc[0], 2.0)
+        self.assertTrue(math.isnan(res['v_future'].iloc[1]))
+        self.assertTrue(math.isnan(res['v_future'].iloc[2]))
+
+    def test_execute_drop_target_na(self):
+        processor = ForwardDataProcessor('v', 'year', ['k'], lambda e : e + 1)
+
+        res = processor.execute(self.__frame())
+
+        self.assertEqual(list(res['v_future']), [2.0])
+
+if __name__ == '__main__':
+    unittest.main()
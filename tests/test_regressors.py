@@ -0,0 +1,26 @@
+import unittest
+from importlib.util import find_spec
+
+from examl import PolynomialRegressor
+
+@unittest.skipUnless(find_spec('pandas') and find_spec('sklearn'), "pandas and scikit-learn are required")
+class PolynomialRegressorTest(unittest.TestCase):
+
+    def test_fit_predict(self):
+        import pandas as pd
+        from sklearn.linear_model import LinearRegression
+
+        x = pd.DataFrame({'a' : [0.0, 1.0, 2.0, 3.0, 4.0]})
+        y = pd.Series([0.0, 1.0, 4.0, 9.0, 16.0])
+
+        regressor = PolynomialRegressor(LinearRegression, degree=2)
+        regressor.fit(x, y)
+
+        pred = regressor.predict(pd.DataFrame({'a' : [5.0, 6.0]}))
+
+        self.assertAlmostEqual(pred[0], 25.0)
+        self.assertAlmostEqual(pred[1], 36.0)
+        self.assertAlmostEqual(regressor.score(x, y), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()